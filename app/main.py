@@ -4,6 +4,7 @@ RAG Document Assistant - Streamlit Interface
 Upload documents and chat with them using local LLMs.
 """
 
+import shutil
 import streamlit as st
 from pathlib import Path
 import sys
@@ -11,9 +12,10 @@ import sys
 # Add parent directory for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.rag.ingest import ingest_document
-from app.rag.embeddings import get_or_create_collection, add_documents
-from app.rag.chat import chat, get_chat_history
+from app.rag.worker import submit_ingest
+from app.rag.retrieval import retrieve
+from app.rag.chat import chat_stream, extract_sources, get_chat_history, prefetch_llm
+from app.rag.embeddings import prefetch_embedder
 
 # Page config
 st.set_page_config(
@@ -28,6 +30,14 @@ if "messages" not in st.session_state:
 if "documents_loaded" not in st.session_state:
     st.session_state.documents_loaded = []
 
+# Preload both models so the first query doesn't pay their load latency;
+# both warm-ups run on daemon threads, so page render never blocks on a
+# cold Ollama
+if "models_warmed" not in st.session_state:
+    prefetch_llm()
+    prefetch_embedder()
+    st.session_state.models_warmed = True
+
 
 def main():
     st.title("📄 RAG Document Assistant")
@@ -46,24 +56,28 @@ def main():
         
         if uploaded_files:
             if st.button("Process Documents", type="primary"):
-                with st.spinner("Processing documents..."):
-                    for uploaded_file in uploaded_files:
-                        if uploaded_file.name not in st.session_state.documents_loaded:
-                            # Save temporarily
-                            temp_path = Path(f"/tmp/{uploaded_file.name}")
-                            temp_path.write_bytes(uploaded_file.getvalue())
-                            
-                            # Ingest and embed
-                            try:
-                                chunks = ingest_document(str(temp_path))
-                                collection = get_or_create_collection("documents")
-                                add_documents(collection, chunks)
-                                st.session_state.documents_loaded.append(uploaded_file.name)
-                                st.success(f"✅ {uploaded_file.name}")
-                            except Exception as e:
-                                st.error(f"❌ {uploaded_file.name}: {str(e)}")
-                            finally:
-                                temp_path.unlink(missing_ok=True)
+                # Queue everything first so the worker pipelines files
+                jobs = []
+                for uploaded_file in uploaded_files:
+                    if uploaded_file.name not in st.session_state.documents_loaded:
+                        # Stream to disk in page-sized blocks; getvalue()
+                        # would materialize a full copy of the upload
+                        temp_path = Path(f"/tmp/{uploaded_file.name}")
+                        uploaded_file.seek(0)
+                        with temp_path.open("wb", buffering=4096) as f:
+                            shutil.copyfileobj(uploaded_file, f, length=4096)
+                        jobs.append((uploaded_file.name, temp_path, submit_ingest(str(temp_path))))
+
+                for name, temp_path, job in jobs:
+                    with st.status(f"Processing {name}..."):
+                        success, detail = job.wait()
+                    temp_path.unlink(missing_ok=True)
+
+                    if success:
+                        st.session_state.documents_loaded.append(name)
+                        st.success(f"✅ {name}")
+                    else:
+                        st.error(f"❌ {name}: {detail}")
         
         # Show loaded documents
         if st.session_state.documents_loaded:
@@ -108,32 +122,42 @@ def main():
         
         # Generate response
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                try:
-                    response = chat(
+            try:
+                # Load the LLM while the ANN search runs
+                prefetch_llm()
+
+                with st.spinner("Searching documents..."):
+                    results = retrieve(prompt, collection_name="documents")
+
+                if not results:
+                    answer = "I don't have any documents to search. Please upload some documents first."
+                    sources = []
+                    st.markdown(answer)
+                else:
+                    # Stream tokens as they arrive instead of blocking
+                    answer = st.write_stream(chat_stream(
                         query=prompt,
-                        collection_name="documents",
+                        results=results,
                         chat_history=get_chat_history(st.session_state.messages)
-                    )
-                    
-                    st.markdown(response.answer)
-                    
-                    # Show sources
-                    if response.sources:
-                        with st.expander("📚 Sources"):
-                            for source in response.sources:
-                                st.markdown(f"- {source}")
-                    
-                    # Save to history
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": response.answer,
-                        "sources": response.sources
-                    })
-                    
-                except Exception as e:
-                    st.error(f"Error: {str(e)}")
-                    st.info("Make sure Ollama is running: `ollama serve`")
+                    ))
+                    sources = extract_sources(results)
+
+                # Show sources
+                if sources:
+                    with st.expander("📚 Sources"):
+                        for source in sources:
+                            st.markdown(f"- {source}")
+
+                # Save to history
+                st.session_state.messages.append({
+                    "role": "assistant",
+                    "content": answer,
+                    "sources": sources
+                })
+
+            except Exception as e:
+                st.error(f"Error: {str(e)}")
+                st.info("Make sure Ollama is running: `ollama serve`")
 
 
 if __name__ == "__main__":
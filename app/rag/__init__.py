@@ -1,15 +1,26 @@
 """RAG Pipeline Components."""
 
-from .ingest import ingest_document
-from .embeddings import get_or_create_collection, add_documents
-from .retrieval import retrieve
-from .chat import chat, ChatResponse
-
-__all__ = [
-    "ingest_document",
-    "get_or_create_collection",
-    "add_documents",
-    "retrieve",
-    "chat",
-    "ChatResponse",
-]
+from importlib import import_module
+
+# Exports are imported lazily (PEP 562): ingest_directory's pool workers
+# only need ingest, and shouldn't pay for chromadb, httpx, or the numba
+# warm-up that the other modules pull in at import time.
+_EXPORTS = {
+    "ingest_document": ".ingest",
+    "get_or_create_collection": ".embeddings",
+    "add_documents": ".embeddings",
+    "retrieve": ".retrieval",
+    "submit_ingest": ".worker",
+    "chat": ".chat",
+    "chat_async": ".chat",
+    "chat_stream": ".chat",
+    "ChatResponse": ".chat",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
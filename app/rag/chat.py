@@ -4,18 +4,21 @@ Chat Interface
 Conversational RAG with source citations.
 """
 
+import asyncio
+import json
 import os
-from typing import List, Optional
+import threading
+from typing import Iterator, List
 from dataclasses import dataclass
 
-from langchain_ollama import ChatOllama
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
+import httpx
 
+from .embeddings import OLLAMA_BASE_URL
 from .retrieval import retrieve, format_context, RetrievalResult
 
 
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.2")
+OLLAMA_TIMEOUT = 120
 
 
 @dataclass
@@ -44,83 +47,199 @@ CHAT HISTORY:
 """
 
 
-def get_llm():
-    """Get the LLM."""
-    return ChatOllama(
-        model=OLLAMA_MODEL,
-        temperature=0.3,  # Lower temperature for more factual responses
+_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Get the shared HTTP client (keep-alive, reused across requests)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(timeout=OLLAMA_TIMEOUT)
+        return _client
+
+
+def _chat_payload(query: str, results: List[RetrievalResult], chat_history: str) -> dict:
+    """Build the /api/chat request body."""
+    system = SYSTEM_PROMPT.format(
+        context=format_context(results),
+        chat_history=chat_history or "No previous conversation."
     )
+    return {
+        "model": OLLAMA_MODEL,
+        "messages": [
+            {"role": "system", "content": system},
+            {"role": "user", "content": query},
+        ],
+        "options": {"temperature": 0.3},  # Lower temperature for more factual responses
+        "stream": True,
+    }
+
+
+def _parse_stream_line(line: str):
+    """Extract (token, done) from one line of Ollama's streaming response."""
+    if not line:
+        return "", False
+    data = json.loads(line)
+    return data.get("message", {}).get("content", ""), bool(data.get("done"))
+
+
+def prefetch_llm() -> None:
+    """
+    Fire-and-forget request that pages the chat model into memory.
+
+    Called before retrieval so Ollama loads the model while the ANN
+    search runs, instead of serially afterwards.
+    """
+    def _warm():
+        try:
+            _get_client().post(
+                OLLAMA_BASE_URL + "/api/generate",
+                json={"model": OLLAMA_MODEL, "prompt": "", "keep_alive": "24h"},
+            )
+        except httpx.HTTPError:
+            pass  # Warm-up is best-effort
+
+    threading.Thread(target=_warm, daemon=True).start()
 
 
 def get_chat_history(messages: List[dict]) -> str:
     """Format chat history for the prompt."""
     if not messages:
         return "No previous conversation."
-    
+
     history_parts = []
     for msg in messages[-6:]:  # Last 3 exchanges
         role = "Human" if msg["role"] == "user" else "Assistant"
         history_parts.append(f"{role}: {msg['content']}")
-    
+
     return "\n".join(history_parts)
 
 
-def chat(
+def extract_sources(results: List[RetrievalResult]) -> List[str]:
+    """Extract unique source citations, preserving retrieval order."""
+    return list(dict.fromkeys(
+        f"{r.source} (page {r.page})" if r.page else r.source
+        for r in results
+    ))
+
+
+def chat_stream(
+    query: str,
+    results: List[RetrievalResult],
+    chat_history: str = "",
+) -> Iterator[str]:
+    """
+    Stream answer tokens for a query over already-retrieved results.
+
+    Yields tokens as Ollama produces them, so callers (e.g. st.write_stream)
+    can render the answer incrementally instead of waiting for completion.
+
+    Args:
+        query: The user's question
+        results: Retrieved document chunks (see retrieve())
+        chat_history: Formatted chat history
+
+    Yields:
+        Answer tokens as they arrive
+    """
+    with _get_client().stream(
+        "POST",
+        OLLAMA_BASE_URL + "/api/chat",
+        json=_chat_payload(query, results, chat_history),
+    ) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            token, done = _parse_stream_line(line)
+            if token:
+                yield token
+            if done:
+                break
+
+
+async def _warm_llm_async(client: httpx.AsyncClient) -> None:
+    """Ask Ollama to page the chat model in while retrieval runs."""
+    try:
+        await client.post(
+            OLLAMA_BASE_URL + "/api/generate",
+            json={"model": OLLAMA_MODEL, "prompt": "", "keep_alive": "24h"},
+        )
+    except httpx.HTTPError:
+        pass  # Warm-up is best-effort
+
+
+async def chat_async(
     query: str,
     collection_name: str = "documents",
     chat_history: str = "",
     top_k: int = 5,
 ) -> ChatResponse:
     """
-    Chat with documents using RAG.
-    
+    Chat with documents using RAG, overlapping retrieval with LLM warm-up.
+
+    Retrieval (embed + ANN search) and the model warm-up request run
+    concurrently, so the LLM is resident by the time the context is ready.
+
     Args:
         query: The user's question
         collection_name: Name of the document collection
         chat_history: Formatted chat history
         top_k: Number of documents to retrieve
-        
+
     Returns:
         ChatResponse with answer and sources
     """
-    # Retrieve relevant documents
-    results = retrieve(query, collection_name, top_k)
-    
-    if not results:
+    async with httpx.AsyncClient(timeout=OLLAMA_TIMEOUT) as client:
+        results, _ = await asyncio.gather(
+            asyncio.to_thread(retrieve, query, collection_name, top_k),
+            _warm_llm_async(client),
+        )
+
+        if not results:
+            return ChatResponse(
+                answer="I don't have any documents to search. Please upload some documents first.",
+                sources=[],
+                context_used=[]
+            )
+
+        tokens = []
+        async with client.stream(
+            "POST",
+            OLLAMA_BASE_URL + "/api/chat",
+            json=_chat_payload(query, results, chat_history),
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                token, done = _parse_stream_line(line)
+                if token:
+                    tokens.append(token)
+                if done:
+                    break
+
         return ChatResponse(
-            answer="I don't have any documents to search. Please upload some documents first.",
-            sources=[],
-            context_used=[]
+            answer="".join(tokens),
+            sources=extract_sources(results),
+            context_used=results
         )
-    
-    # Format context
-    context = format_context(results)
-    
-    # Build prompt
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", SYSTEM_PROMPT),
-        ("human", "{question}")
-    ])
-    
-    # Create chain
-    llm = get_llm()
-    chain = prompt | llm | StrOutputParser()
-    
-    # Generate response
-    answer = chain.invoke({
-        "context": context,
-        "chat_history": chat_history,
-        "question": query
-    })
-    
-    # Extract unique sources
-    sources = list(set(
-        f"{r.source}" + (f" (page {r.page})" if r.page else "")
-        for r in results
-    ))
-    
-    return ChatResponse(
-        answer=answer,
-        sources=sources,
-        context_used=results
-    )
+
+
+def chat(
+    query: str,
+    collection_name: str = "documents",
+    chat_history: str = "",
+    top_k: int = 5,
+) -> ChatResponse:
+    """
+    Chat with documents using RAG.
+
+    Args:
+        query: The user's question
+        collection_name: Name of the document collection
+        chat_history: Formatted chat history
+        top_k: Number of documents to retrieve
+
+    Returns:
+        ChatResponse with answer and sources
+    """
+    return asyncio.run(chat_async(query, collection_name, chat_history, top_k))
@@ -4,52 +4,263 @@ Embeddings and Vector Storage
 Embed document chunks and store in ChromaDB.
 """
 
+import hashlib
 import os
-from typing import List, Optional
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, List
+
 import chromadb
+import numpy as np
+import requests
 from chromadb.config import Settings
-from langchain_ollama import OllamaEmbeddings
 
 from .ingest import DocumentChunk
 
 
 # Default settings
 CHROMA_PERSIST_DIR = os.getenv("CHROMA_PERSIST_DIR", "./data/chroma")
+OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 OLLAMA_EMBED_MODEL = os.getenv("OLLAMA_EMBED_MODEL", "nomic-embed-text")
+EMBED_CACHE_PATH = os.getenv("EMBED_CACHE_PATH", "./data/embed_cache.db")
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "64"))
+EMBED_QUANT = os.getenv("EMBED_QUANT", "float32")  # float32 | int8
+ADD_BATCH_SIZE = int(os.getenv("ADD_BATCH_SIZE", "256"))
+
+# SQLite caps the number of bound parameters per statement
+_SQLITE_MAX_VARS = 900
+
+_cache_conn = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache_db() -> sqlite3.Connection:
+    """Get the shared SQLite connection for the embedding cache."""
+    global _cache_conn
+    with _cache_lock:
+        if _cache_conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(EMBED_CACHE_PATH)), exist_ok=True)
+            _cache_conn = sqlite3.connect(EMBED_CACHE_PATH, check_same_thread=False)
+            _cache_conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (hash BLOB PRIMARY KEY, vec BLOB)"
+            )
+            _cache_conn.commit()
+        return _cache_conn
+
+
+class BatchedOllamaEmbeddings:
+    """
+    Ollama embedder that sends whole batches to /api/embed.
+
+    Ollama's /api/embed endpoint accepts an array of inputs, so embedding
+    64 chunks costs one HTTP round-trip instead of 64. A keep-alive
+    requests.Session avoids re-handshaking, and batches run on a small
+    thread pool so HTTP overhead overlaps.
+    """
 
+    def __init__(
+        self,
+        model: str = OLLAMA_EMBED_MODEL,
+        base_url: str = OLLAMA_BASE_URL,
+        batch_size: int = EMBED_BATCH_SIZE,
+    ):
+        self.model = model
+        self.url = base_url.rstrip("/") + "/api/embed"
+        self.batch_size = batch_size
+        self.session = requests.Session()
+
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        response = self.session.post(
+            self.url,
+            json={"model": self.model, "input": batch},
+            timeout=120,
+        )
+        response.raise_for_status()
+        return response.json()["embeddings"]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of texts, batching requests to Ollama."""
+        if not texts:
+            return []
+
+        batches = [
+            texts[start:start + self.batch_size]
+            for start in range(0, len(texts), self.batch_size)
+        ]
+
+        if len(batches) == 1:
+            return self._embed_batch(batches[0])
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(self._embed_batch, batches))
+
+        return [vec for batch in results for vec in batch]
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query text."""
+        return self.embed_documents([text])[0]
+
+
+def prefetch_embedder() -> None:
+    """
+    Fire-and-forget request that pages the embedding model into memory.
 
+    keep_alive pins the model so the first real query doesn't pay its
+    load latency; runs on a daemon thread so callers never block.
+    """
+    def _warm():
+        try:
+            requests.post(
+                OLLAMA_BASE_URL + "/api/embed",
+                json={"model": OLLAMA_EMBED_MODEL, "input": "warm", "keep_alive": "24h"},
+                timeout=120,
+            )
+        except requests.RequestException:
+            pass  # Warm-up is best-effort
+
+    threading.Thread(target=_warm, daemon=True).start()
+
+
+def quantize_int8(vec: List[float]) -> List[float]:
+    """
+    Scalar-quantize a vector to int8 levels (symmetric, per-vector scale).
+
+    Cosine similarity is scale-invariant, so the per-vector scale cancels
+    and quantized vectors rank almost identically in the cosine HNSW index
+    while compressing the value range to 255 levels.
+    """
+    v = np.asarray(vec, dtype=np.float32)
+    scale = (float(np.max(np.abs(v))) / 127.0) or 1.0
+    return np.clip(np.round(v / scale), -127, 127).astype(np.float32).tolist()
+
+
+@lru_cache(maxsize=1)
 def get_embeddings():
-    """Get the embedding model."""
-    return OllamaEmbeddings(model=OLLAMA_EMBED_MODEL)
+    """Get the embedding model (shared, so its keep-alive session is reused)."""
+    return BatchedOllamaEmbeddings()
+
+
+@lru_cache(maxsize=1)
+def _get_embedding_function() -> "OllamaEmbeddingFunction":
+    """Get the shared cache-backed embedding function."""
+    return OllamaEmbeddingFunction(get_embeddings())
+
+
+def embed_texts(texts: List[str]) -> List[List[float]]:
+    """Embed texts through the batched embedder and persistent cache."""
+    return _get_embedding_function()(texts)
+
+
+def _enable_wal(persist_dir: str) -> None:
+    """
+    Switch Chroma's SQLite store to WAL mode.
+
+    WAL lets reads proceed concurrently with bulk writes during ingestion.
+    The mode is persistent (stored in the database header), so setting it
+    once from a side connection applies to Chroma's own connections too.
+    """
+    db_path = os.path.join(persist_dir, "chroma.sqlite3")
+    if not os.path.exists(db_path):
+        return
+    try:
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+    except sqlite3.Error:
+        pass  # Tuning is best-effort; Chroma works either way
 
 
 def get_chroma_client():
     """Get or create ChromaDB client."""
-    return chromadb.PersistentClient(
+    client = chromadb.PersistentClient(
         path=CHROMA_PERSIST_DIR,
         settings=Settings(anonymized_telemetry=False)
     )
+    _enable_wal(CHROMA_PERSIST_DIR)
+    return client
+
+
+class OllamaEmbeddingFunction:
+    """
+    Embedding function for Chroma with a persistent on-disk cache.
+
+    Texts are keyed by sha256(model + text) in a SQLite table, so repeated
+    queries and re-ingested chunks skip the Ollama round-trip entirely.
+    Keying by model name means switching OLLAMA_EMBED_MODEL never collides.
+    """
+
+    def __init__(self, embeddings, model_name: str = OLLAMA_EMBED_MODEL):
+        self.embeddings = embeddings
+        self.model_name = model_name
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256((self.model_name + "\x00" + text).encode()).digest()
+
+    def _cache_get(self, keys: List[bytes]) -> dict:
+        db = _get_cache_db()
+        found = {}
+        with _cache_lock:
+            for start in range(0, len(keys), _SQLITE_MAX_VARS):
+                batch = keys[start:start + _SQLITE_MAX_VARS]
+                placeholders = ",".join("?" * len(batch))
+                rows = db.execute(
+                    f"SELECT hash, vec FROM embeddings WHERE hash IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def _cache_put(self, keys: List[bytes], vectors: List[List[float]]) -> None:
+        db = _get_cache_db()
+        rows = [
+            (key, np.asarray(vec, dtype=np.float32).tobytes())
+            for key, vec in zip(keys, vectors)
+        ]
+        with _cache_lock:
+            db.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?)", rows)
+            db.commit()
 
+    def __call__(self, input: List[str]) -> List[List[float]]:
+        keys = [self._key(text) for text in input]
+        cached = self._cache_get(keys)
 
+        # Embed only texts we haven't seen before (dedup within the batch)
+        missing = {}
+        for text, key in zip(input, keys):
+            if key not in cached and key not in missing:
+                missing[key] = text
+
+        if missing:
+            vectors = self.embeddings.embed_documents(list(missing.values()))
+            self._cache_put(list(missing.keys()), vectors)
+            cached.update(zip(missing.keys(), vectors))
+
+        # Quantize post-cache so the cache keeps full-precision vectors
+        if EMBED_QUANT == "int8":
+            return [quantize_int8(cached[key]) for key in keys]
+
+        return [cached[key] for key in keys]
+
+
+@lru_cache(maxsize=8)
 def get_or_create_collection(name: str = "documents"):
-    """Get or create a ChromaDB collection."""
+    """Get or create a ChromaDB collection (cached per process)."""
     client = get_chroma_client()
-    
-    # Get embedding function
-    embeddings = get_embeddings()
-    
-    # Create custom embedding function for Chroma
-    class OllamaEmbeddingFunction:
-        def __init__(self, embeddings):
-            self.embeddings = embeddings
-            
-        def __call__(self, input: List[str]) -> List[List[float]]:
-            return self.embeddings.embed_documents(input)
-    
+
     collection = client.get_or_create_collection(
         name=name,
-        embedding_function=OllamaEmbeddingFunction(embeddings),
-        metadata={"hnsw:space": "cosine"}
+        embedding_function=_get_embedding_function(),
+        metadata={
+            "hnsw:space": "cosine",
+            # Denser graph + wider construction beam: better recall for
+            # the same query cost, paid for once at index build time
+            "hnsw:construction_ef": 200,
+            "hnsw:M": 32,
+            "hnsw:search_ef": 64,
+        }
     )
     
     return collection
@@ -57,29 +268,73 @@ def get_or_create_collection(name: str = "documents"):
 
 def add_documents(
     collection,
-    chunks: List[DocumentChunk],
-) -> None:
+    chunks: Iterable[DocumentChunk],
+) -> int:
     """
     Add document chunks to a collection.
-    
+
+    Accepts any iterable (e.g. iter_document_chunks) and consumes it in
+    batches of ADD_BATCH_SIZE, so embedding overlaps parsing instead of
+    waiting for the whole document. Chunks are keyed by a hash of their
+    content, so re-ingesting an unchanged document adds (and embeds)
+    nothing.
+
     Args:
         collection: ChromaDB collection
-        chunks: List of DocumentChunk objects
+        chunks: Iterable of DocumentChunk objects
+
+    Returns:
+        Number of new chunks added
     """
-    if not chunks:
-        return
-    
-    # Prepare data for Chroma
-    ids = [f"{chunk.metadata['source']}_{chunk.metadata['chunk_index']}" for chunk in chunks]
-    documents = [chunk.content for chunk in chunks]
-    metadatas = [chunk.metadata for chunk in chunks]
-    
-    # Add to collection
-    collection.add(
-        ids=ids,
-        documents=documents,
-        metadatas=metadatas
-    )
+    total = 0
+    chunks = iter(chunks)
+
+    while True:
+        batch = list(islice(chunks, ADD_BATCH_SIZE))
+        if not batch:
+            break
+
+        # Content-hash ids make ingestion idempotent
+        hashes = [hashlib.sha256(chunk.content.encode()).hexdigest() for chunk in batch]
+        existing = set(collection.get(ids=list(set(hashes)), include=[])["ids"])
+
+        # Keep only unseen chunks, in a single pass over the batch
+        ids, documents, metadatas = [], [], []
+        ids_append, docs_append, meta_append = ids.append, documents.append, metadatas.append
+        for chunk, content_hash in zip(batch, hashes):
+            if content_hash in existing:
+                continue
+            existing.add(content_hash)  # also dedups within the batch
+            ids_append(content_hash)
+            docs_append(chunk.content)
+            meta_append(chunk.metadata)
+
+        if not ids:
+            continue
+
+        # Pre-embed in batches so Chroma skips its internal embedder call
+        embeddings = embed_texts(documents)
+
+        # Add to collection
+        collection.add(
+            ids=ids,
+            documents=documents,
+            metadatas=metadatas,
+            embeddings=embeddings
+        )
+        total += len(ids)
+
+    if total:
+        # Cached query results are stale now that the corpus changed
+        from .retrieval import reset_query_cache
+        reset_query_cache()
+
+    return total
+
+
+def reset_collection_cache() -> None:
+    """Drop cached collection handles (call after deleting collections)."""
+    get_or_create_collection.cache_clear()
 
 
 def delete_collection(name: str = "documents") -> None:
@@ -89,3 +344,8 @@ def delete_collection(name: str = "documents") -> None:
         client.delete_collection(name)
     except ValueError:
         pass  # Collection doesn't exist
+    reset_collection_cache()
+
+    # Drop cached query results pointing at the deleted data
+    from .retrieval import reset_query_cache
+    reset_query_cache()
@@ -5,31 +5,66 @@ Load documents and split them into chunks for embedding.
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 from dataclasses import dataclass
 
+import pymupdf
 from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_core.documents import Document
 from langchain_community.document_loaders import (
-    PyPDFLoader,
     TextLoader,
     UnstructuredMarkdownLoader,
 )
 
+from .io_uring_reader import USE_URING, read_file, read_files_batch
+
 
 @dataclass
 class DocumentChunk:
     """A chunk of text with metadata."""
     content: str
     metadata: dict
-    
+
+
+class PyMuPDFLoader:
+    """
+    PDF loader backed by MuPDF's C extraction.
+
+    MuPDF extracts text several times faster than pypdf. Pages are pulled
+    sequentially — PyMuPDF is not thread-safe within one document, and
+    cross-document parallelism already comes from ingest_directory's
+    process pool — which also keeps peak memory bounded to one page.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+
+    def load(self) -> List[Document]:
+        return list(self.lazy_load())
+
+    def lazy_load(self) -> Iterator[Document]:
+        # Read via the batch reader (io_uring when enabled) and hand
+        # MuPDF the bytes, so parsing never touches the filesystem
+        doc = pymupdf.open(stream=read_file(self.file_path), filetype="pdf")
+        try:
+            for i, page in enumerate(doc):
+                yield Document(
+                    page_content=page.get_text("text"),
+                    metadata={"source": self.file_path, "page": i}
+                )
+        finally:
+            doc.close()
+
 
 def get_loader(file_path: str):
     """Get the appropriate loader based on file extension."""
     ext = Path(file_path).suffix.lower()
-    
+
     loaders = {
-        ".pdf": PyPDFLoader,
+        ".pdf": PyMuPDFLoader,
         ".txt": TextLoader,
         ".md": UnstructuredMarkdownLoader,
     }
@@ -41,6 +76,56 @@ def get_loader(file_path: str):
     return loader_class(file_path)
 
 
+@lru_cache(maxsize=8)
+def _get_splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    """Get a shared splitter for the given settings (built once per process)."""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=len,
+        separators=["\n\n", "\n", ". ", " ", ""]
+    )
+
+
+def iter_document_chunks(
+    file_path: str,
+    chunk_size: int = 1000,
+    chunk_overlap: int = 200,
+) -> Iterator[DocumentChunk]:
+    """
+    Lazily load a document and yield chunks as pages are parsed.
+
+    Streaming page-by-page bounds peak memory to one page instead of the
+    whole file, and lets add_documents start embedding before parsing
+    finishes.
+
+    Args:
+        file_path: Path to the document
+        chunk_size: Size of each chunk in characters
+        chunk_overlap: Overlap between chunks
+
+    Yields:
+        DocumentChunk objects in document order
+    """
+    loader = get_loader(file_path)
+    splitter = _get_splitter(chunk_size, chunk_overlap)
+    file_name = Path(file_path).name
+
+    chunk_index = 0
+    for doc in loader.lazy_load():
+        for text in splitter.split_text(doc.page_content):
+            yield DocumentChunk(
+                content=text,
+                metadata={
+                    **doc.metadata,
+                    "source": file_name,
+                    "chunk_index": chunk_index,
+                    "page": doc.metadata.get("page", 0),
+                }
+            )
+            chunk_index += 1
+
+
 def ingest_document(
     file_path: str,
     chunk_size: int = 1000,
@@ -48,45 +133,16 @@ def ingest_document(
 ) -> List[DocumentChunk]:
     """
     Load a document and split it into chunks.
-    
+
     Args:
         file_path: Path to the document
         chunk_size: Size of each chunk in characters
         chunk_overlap: Overlap between chunks
-        
+
     Returns:
         List of DocumentChunk objects
     """
-    # Load document
-    loader = get_loader(file_path)
-    documents = loader.load()
-    
-    # Split into chunks
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=chunk_size,
-        chunk_overlap=chunk_overlap,
-        length_function=len,
-        separators=["\n\n", "\n", ". ", " ", ""]
-    )
-    
-    splits = splitter.split_documents(documents)
-    
-    # Convert to our format
-    chunks = []
-    file_name = Path(file_path).name
-    
-    for i, split in enumerate(splits):
-        chunks.append(DocumentChunk(
-            content=split.page_content,
-            metadata={
-                "source": file_name,
-                "chunk_index": i,
-                "page": split.metadata.get("page", 0),
-                **split.metadata
-            }
-        ))
-    
-    return chunks
+    return list(iter_document_chunks(file_path, chunk_size, chunk_overlap))
 
 
 def ingest_directory(
@@ -107,17 +163,29 @@ def ingest_directory(
     """
     supported_extensions = {".pdf", ".txt", ".md"}
     all_chunks = []
-    
-    for file_path in Path(dir_path).rglob("*"):
-        if file_path.suffix.lower() in supported_extensions:
+
+    paths = [
+        file_path for file_path in Path(dir_path).rglob("*")
+        if file_path.suffix.lower() in supported_extensions
+    ]
+    if not paths:
+        return all_chunks
+
+    # Batched readahead: one ring submission pulls every file into the
+    # page cache, so the pool workers' own reads don't wait on disk
+    if USE_URING:
+        read_files_batch(paths)
+
+    # Parse files in parallel; parsing is CPU-bound, so use processes
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {
+            executor.submit(ingest_document, str(path), chunk_size, chunk_overlap): path
+            for path in paths
+        }
+        for future in as_completed(futures):
             try:
-                chunks = ingest_document(
-                    str(file_path),
-                    chunk_size=chunk_size,
-                    chunk_overlap=chunk_overlap
-                )
-                all_chunks.extend(chunks)
+                all_chunks.extend(future.result())
             except Exception as e:
-                print(f"Warning: Failed to process {file_path}: {e}")
-    
+                print(f"Warning: Failed to process {futures[future]}: {e}")
+
     return all_chunks
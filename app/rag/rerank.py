@@ -0,0 +1,63 @@
+"""
+Reranking
+---------
+Cross-encoder reranking of ANN candidates.
+"""
+
+import os
+from functools import lru_cache
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .retrieval import RetrievalResult
+
+
+USE_RERANKER = os.getenv("USE_RERANKER", "false").lower() in ("1", "true", "yes")
+RERANK_MODEL = os.getenv("RERANK_MODEL", "BAAI/bge-reranker-base")
+
+
+@lru_cache(maxsize=1)
+def _get_cross_encoder():
+    """Load the cross-encoder once; None if sentence-transformers is missing."""
+    try:
+        from sentence_transformers import CrossEncoder
+    except ImportError:
+        print("Warning: USE_RERANKER is set but sentence-transformers is not installed")
+        return None
+    return CrossEncoder(RERANK_MODEL)
+
+
+def rerank(
+    query: str,
+    results: List["RetrievalResult"],
+    top_k: int,
+) -> List["RetrievalResult"]:
+    """
+    Rerank retrieval results with a cross-encoder.
+
+    Unlike the bi-encoder used for ANN search, the cross-encoder scores
+    each (query, document) pair jointly, which recovers semantically
+    relevant chunks that are lexically distant from the query.
+
+    Args:
+        query: The search query
+        results: Candidate results from the ANN search
+        top_k: Number of results to keep
+
+    Returns:
+        The top_k results ordered by cross-encoder score
+    """
+    model = _get_cross_encoder()
+    if model is None or not results:
+        return results[:top_k]
+
+    scores = model.predict([(query, r.content) for r in results])
+
+    order = sorted(range(len(results)), key=lambda i: scores[i], reverse=True)
+    reranked = []
+    for i in order[:top_k]:
+        result = results[i]
+        result.score = float(scores[i])
+        reranked.append(result)
+
+    return reranked
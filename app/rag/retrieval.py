@@ -5,13 +5,82 @@ Semantic search over embedded documents.
 """
 
 import os
-from typing import List, Optional
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
-from .embeddings import get_or_create_collection, get_embeddings
+import numpy as np
+
+from .embeddings import embed_texts, get_or_create_collection
+from .rerank import USE_RERANKER, rerank
 
 
 TOP_K = int(os.getenv("TOP_K", "5"))
+QUERY_CACHE_SIZE = int(os.getenv("QUERY_CACHE_SIZE", "256"))
+QUERY_CACHE_THRESHOLD = float(os.getenv("QUERY_CACHE_THRESHOLD", "0.97"))
+
+# Semantic query cache: near-duplicate queries ("what is X" vs "tell me
+# about X") reuse cached results instead of re-running the ANN search.
+# One LRU per (collection, top_k), keyed by the normalized query embedding.
+_query_caches: Dict[Tuple[str, int], "OrderedDict[bytes, Tuple[np.ndarray, list]]"] = {}
+_query_cache_lock = threading.Lock()
+
+
+def reset_query_cache() -> None:
+    """Drop cached query results (call whenever the corpus changes)."""
+    with _query_cache_lock:
+        _query_caches.clear()
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _dot_scores(matrix, query):
+        """SIMD dot products of each cached vector against the query."""
+        n = matrix.shape[0]
+        out = np.empty(n, np.float32)
+        for i in prange(n):
+            s = 0.0
+            for j in range(matrix.shape[1]):
+                s += matrix[i, j] * query[j]
+            out[i] = s
+        return out
+
+    # Warm up the JIT at import so the first query doesn't pay compile cost
+    _dot_scores(np.zeros((1, 4), np.float32), np.zeros(4, np.float32))
+else:
+    def _dot_scores(matrix, query):
+        """NumPy fallback when numba isn't installed."""
+        return matrix @ query
+
+
+def _cache_lookup(cache, query_vec: np.ndarray):
+    """Return cached results for the most similar query, if similar enough."""
+    with _query_cache_lock:
+        if not cache:
+            return None
+
+        keys = list(cache.keys())
+        matrix = np.stack([cache[key][0] for key in keys])
+        sims = _dot_scores(matrix, query_vec)
+        best = int(np.argmax(sims))
+
+        if sims[best] >= QUERY_CACHE_THRESHOLD:
+            cache.move_to_end(keys[best])
+            return cache[keys[best]][1]
+        return None
+
+
+def _cache_insert(cache, query_vec: np.ndarray, results: list) -> None:
+    """Insert a query's results, evicting the least recently used entry."""
+    with _query_cache_lock:
+        cache[query_vec.tobytes()] = (query_vec, results)
+        while len(cache) > QUERY_CACHE_SIZE:
+            cache.popitem(last=False)
 
 
 @dataclass
@@ -42,32 +111,58 @@ def retrieve(
     """
     if top_k is None:
         top_k = TOP_K
-    
+
+    # Embed the query once (served from the persistent cache on repeats)
+    query_vec = np.asarray(embed_texts([query])[0], dtype=np.float32)
+    query_vec /= np.linalg.norm(query_vec) or 1.0
+
+    # Check the semantic cache for a near-duplicate query
+    cache = _query_caches.setdefault((collection_name, top_k), OrderedDict())
+    cached_results = _cache_lookup(cache, query_vec)
+    if cached_results is not None:
+        return cached_results
+
     collection = get_or_create_collection(collection_name)
-    
+
+    # With reranking enabled, over-fetch candidates for the cross-encoder
+    n_results = max(top_k * 5, 25) if USE_RERANKER else top_k
+
     # Query the collection
     results = collection.query(
-        query_texts=[query],
-        n_results=top_k,
+        query_embeddings=[query_vec.tolist()],
+        n_results=n_results,
         include=["documents", "metadatas", "distances"]
     )
     
     # Convert to our format
     retrieval_results = []
-    
+
     if results["documents"] and results["documents"][0]:
-        for i, doc in enumerate(results["documents"][0]):
-            metadata = results["metadatas"][0][i] if results["metadatas"] else {}
-            distance = results["distances"][0][i] if results["distances"] else 0
-            
-            retrieval_results.append(RetrievalResult(
+        docs = results["documents"][0]
+        metadatas = results["metadatas"][0] if results["metadatas"] else [{}] * len(docs)
+        distances = results["distances"][0] if results["distances"] else [0.0] * len(docs)
+
+        # Convert distances to similarities in one vectorized pass
+        scores = 1.0 - np.asarray(distances, dtype=np.float32)
+
+        retrieval_results = [
+            RetrievalResult(
                 content=doc,
                 source=metadata.get("source", "Unknown"),
                 page=metadata.get("page", 0),
-                score=1 - distance,  # Convert distance to similarity
+                score=float(score),
                 metadata=metadata
-            ))
-    
+            )
+            for doc, metadata, score in zip(docs, metadatas, scores)
+        ]
+
+    if USE_RERANKER:
+        retrieval_results = rerank(query, retrieval_results, top_k)
+
+    # Never cache misses: an empty collection is not a stable answer
+    if retrieval_results:
+        _cache_insert(cache, query_vec, retrieval_results)
+
     return retrieval_results
 
 
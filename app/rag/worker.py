@@ -0,0 +1,77 @@
+"""
+Ingestion Worker
+----------------
+Background thread that parses and embeds documents off the UI thread.
+"""
+
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+from .ingest import iter_document_chunks
+from .embeddings import get_or_create_collection, add_documents
+
+
+@dataclass
+class IngestJob:
+    """A queued ingestion request with a per-job reply channel."""
+    file_path: str
+    collection_name: str = "documents"
+    replies: "queue.Queue" = field(default_factory=queue.Queue)
+
+    def wait(self, timeout: Optional[float] = None) -> Tuple[bool, str]:
+        """Block until the worker finishes this job.
+
+        Returns:
+            (success, detail) where detail is a chunk count or error message
+        """
+        return self.replies.get(timeout=timeout)
+
+
+_jobs: "queue.Queue[IngestJob]" = queue.Queue()
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+
+def _loop() -> None:
+    """Consume jobs forever, one parse+embed+add pipeline per job."""
+    while True:
+        job = _jobs.get()
+        try:
+            collection = get_or_create_collection(job.collection_name)
+            # Stream chunks so embedding overlaps parsing
+            count = add_documents(collection, iter_document_chunks(job.file_path))
+            job.replies.put((True, f"{count} chunks"))
+        except Exception as e:
+            job.replies.put((False, str(e)))
+        finally:
+            _jobs.task_done()
+
+
+def _ensure_worker() -> None:
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_loop, name="ingest-worker", daemon=True)
+            _worker.start()
+
+
+def submit_ingest(file_path: str, collection_name: str = "documents") -> IngestJob:
+    """
+    Queue a document for background ingestion.
+
+    The UI thread stays responsive while the worker does the heavy
+    parse/embed work; call IngestJob.wait() for the outcome.
+
+    Args:
+        file_path: Path to the document on disk
+        collection_name: Collection to add the chunks to
+
+    Returns:
+        An IngestJob handle
+    """
+    _ensure_worker()
+    job = IngestJob(file_path, collection_name)
+    _jobs.put(job)
+    return job